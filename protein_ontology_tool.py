@@ -9,12 +9,58 @@ annotation (PAF) files, providing an interactive interface for querying.
 
 import os
 import hashlib
+import shutil
 import requests
 import json
+import mmap
+import pickle
 import re
+import sys
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import argparse
+import heapq
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Hashes are only used to detect local file changes, so prefer a fast
+# non-cryptographic hash and fall back to BLAKE2 from the standard library
+HASH_ALGORITHM = "xxh3_64" if xxhash is not None else "blake2b"
+
+# Read/write block size for hashing and downloads (1 MiB)
+CHUNK_SIZE = 1 << 20
+
+# Bump when the layout of the cached parsed data changes
+CACHE_VERSION = 4
+
+# An OBO [Term] stanza runs until the next stanza header or the end of the file
+OBO_TERM_RE = re.compile(rb'^\[Term\][ \t\r]*\n((?:[^\[\n][^\n]*\n?|\n)*)', re.M)
+
+# OBO tags whose values repeat across many terms; their values are interned
+# so every term shares a single string object per distinct value
+OBO_INTERNED_TAGS = frozenset(('is_a', 'relationship', 'comment', 'subset'))
+
+# Limited searches merge token postings only when this few tokens match;
+# past that, matching rows are dense enough that a plain scan is faster
+MERGE_MAX_TOKENS = 64
+
+# OBO fields searched (and indexed) by default
+OBO_SEARCH_FIELDS = ('id', 'name', 'def')
 
 
 class ProteinDataManager:
@@ -32,6 +78,15 @@ class ProteinDataManager:
         self.obo_file = os.path.join(data_dir, "protein_ontology.obo")
         self.paf_file = os.path.join(data_dir, "protein_annotations.paf")
         self.version_file = os.path.join(data_dir, "versions.json")
+        self.obo_cache_file = os.path.join(data_dir, "obo_cache.pkl")
+        self.paf_cache_file = os.path.join(data_dir, "paf_cache.pkl")
+        # The OBO and PAF files are updated on worker threads
+        self._print_lock = threading.Lock()
+    
+    def _print(self, message: str) -> None:
+        """Print a message without interleaving it with other threads' output."""
+        with self._print_lock:
+            print(message)
         
     def setup_data_directory(self) -> None:
         """Create .PRO directory if it doesn't exist."""
@@ -41,40 +96,87 @@ class ProteinDataManager:
         else:
             print(f"Using existing directory: {self.data_dir}")
     
-    def calculate_file_hash(self, file_path: str) -> Optional[str]:
-        """Calculate SHA-256 hash of a file.
+    def calculate_file_hash(self, file_path: str, algorithm: str = HASH_ALGORITHM) -> Optional[str]:
+        """Calculate the hash of a file.
         
         Args:
             file_path: Path to the file
+            algorithm: "xxh3_64" or any algorithm name accepted by hashlib.new
             
         Returns:
             Hexadecimal hash string or None if file doesn't exist
         """
         if not os.path.exists(file_path):
             return None
+        if algorithm == "xxh3_64" and xxhash is None:
+            self._print(f"Cannot verify {file_path}: xxhash is not installed")
+            return None
             
-        hash_sha256 = hashlib.sha256()
         try:
+            if algorithm == "xxh3_64":
+                hasher = xxhash.xxh3_64()
+            else:
+                hasher = hashlib.new(algorithm)
+            # Reuse a single buffer instead of allocating a new bytes object per chunk
+            buffer = bytearray(CHUNK_SIZE)
+            view = memoryview(buffer)
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+                while True:
+                    n = f.readinto(buffer)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+            return hasher.hexdigest()
         except Exception as e:
-            print(f"Error calculating hash for {file_path}: {e}")
+            self._print(f"Error calculating hash for {file_path}: {e}")
+            return None
+    
+    def get_file_stat(self, file_path: str) -> Optional[Tuple[int, int]]:
+        """Get modification time and size of a file.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Tuple of (mtime in nanoseconds, size in bytes) or None if file doesn't exist
+        """
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return None
+        return st.st_mtime_ns, st.st_size
+    
+    def get_recorded_hash(self, file_path: str, prefix: str) -> Optional[str]:
+        """Get the recorded hash of a data file if the file hasn't changed since.
+        
+        Args:
+            file_path: Path to the file
+            prefix: Key prefix in the version file ("obo" or "paf")
+            
+        Returns:
+            "algorithm:hexdigest" string, or None if the file's mtime or size
+            no longer match the recorded values
+        """
+        version_info = self.load_version_info()
+        recorded_stat = (version_info.get(f"{prefix}_mtime"), version_info.get(f"{prefix}_size"))
+        file_hash = version_info.get(f"{prefix}_hash")
+        if not file_hash or self.get_file_stat(file_path) != recorded_stat:
+            return None
+        return f"{version_info.get(f'{prefix}_hash_algorithm', 'sha256')}:{file_hash}"
     
     def load_version_info(self) -> Dict[str, str]:
         """Load version information from JSON file.
         
         Returns:
-            Dictionary mapping file names to their hashes
+            Dictionary mapping file names to their hashes, stats and update times
         """
         if not os.path.exists(self.version_file):
             return {}
             
         try:
-            with open(self.version_file, 'r') as f:
-                return json.load(f)
+            with open(self.version_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         except Exception as e:
             print(f"Error loading version info: {e}")
             return {}
@@ -86,39 +188,131 @@ class ProteinDataManager:
             version_info: Dictionary mapping file names to their hashes
         """
         try:
-            with open(self.version_file, 'w') as f:
-                json.dump(version_info, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(version_info, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(version_info, indent=2).encode('utf-8')
+            with open(self.version_file, 'wb') as f:
+                f.write(data)
         except Exception as e:
             print(f"Error saving version info: {e}")
     
-    def download_file(self, url: str, local_path: str) -> bool:
+    def download_file(self, url: str, local_path: str, etag: Optional[str] = None,
+                      last_modified: Optional[str] = None) -> Optional[requests.Response]:
         """Download a file from URL to local path.
         
+        When ``etag`` or ``last_modified`` are given the request is made
+        conditional, and the local file is left untouched if the server
+        answers 304 Not Modified.
+        
         Args:
             url: URL to download from
             local_path: Local path to save to
+            etag: ETag recorded from a previous download
+            last_modified: Last-Modified value recorded from a previous download
             
         Returns:
-            True if download successful, False otherwise
+            The (closed) response if successful or not modified, None otherwise
         """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
         try:
-            print(f"Downloading {url}...")
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            self._print(f"Checking {url} for updates..." if headers else f"Downloading {url}...")
+            with requests.get(url, stream=True, headers=headers) as response:
+                if response.status_code == 304:
+                    self._print(f"Not modified on server: {url}")
+                    return response
+                response.raise_for_status()
+                # Let urllib3 undo any Content-Encoding and copy in large blocks
+                response.raw.decode_content = True
+                # Write to a temporary file and swap it in, so a failed download
+                # never leaves a truncated file and open memory maps stay valid
+                tmp_path = local_path + '.part'
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
+                    os.replace(tmp_path, local_path)
+                except Exception:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
             
-            print(f"Downloaded to: {local_path}")
-            return True
+            self._print(f"Downloaded to: {local_path}")
+            return response
         except Exception as e:
-            print(f"Error downloading {url}: {e}")
-            return False
+            self._print(f"Error downloading {url}: {e}")
+            return None
+    
+    def _update_one(self, prefix: str, url: str, file_path: str, version_info: Dict[str, str],
+                    check_remote: bool, current_time: str) -> Optional[Dict[str, str]]:
+        """Check a single data file and download it if needed.
+        
+        Only reads ``version_info``; the caller merges the returned entries,
+        so the OBO and PAF files can be checked concurrently.
+        
+        Args:
+            prefix: Key prefix in the version file ("obo" or "paf")
+            url: URL to download from
+            file_path: Local path of the data file
+            version_info: Current version information
+            check_remote: Also ask the server whether a newer file is available
+            current_time: Timestamp recorded for a new download
+            
+        Returns:
+            Version info entries to update, or None if a needed download failed
+        """
+        updates = {}
+        
+        # Only re-hash when mtime or size changed
+        needs_download = False
+        file_stat = self.get_file_stat(file_path)
+        if file_stat is None or file_stat != (version_info.get(f"{prefix}_mtime"), version_info.get(f"{prefix}_size")):
+            # Verify with the algorithm the recorded hash was made with (SHA-256 before it was tracked)
+            # If that hash can't be computed here (e.g. xxhash is missing), the
+            # file can't be verified and is downloaded again
+            file_hash = self.calculate_file_hash(file_path, version_info.get(f"{prefix}_hash_algorithm", "sha256"))
+            if file_hash is None or file_hash != version_info.get(f"{prefix}_hash"):
+                self._print(f"{prefix.upper()} file needs update or doesn't exist")
+                needs_download = True
+        
+        if needs_download or check_remote:
+            # Only send validators when the local copy is intact
+            if needs_download:
+                response = self.download_file(url, file_path)
+            else:
+                response = self.download_file(url, file_path,
+                                              version_info.get(f"{prefix}_etag"),
+                                              version_info.get(f"{prefix}_last_modified"))
+            if response is None:
+                if needs_download:
+                    return None
+                # The local copy was just verified, so an unreachable server isn't fatal
+                self._print(f"Warning: could not check {url} for updates, keeping local {prefix.upper()} file")
+            elif response.status_code != 304:
+                updates[f"{prefix}_hash"] = self.calculate_file_hash(file_path)
+                updates[f"{prefix}_hash_algorithm"] = HASH_ALGORITHM
+                updates[f"{prefix}_last_updated"] = current_time
+                updates[f"{prefix}_etag"] = response.headers.get("ETag")
+                updates[f"{prefix}_last_modified"] = response.headers.get("Last-Modified")
+        
+        updates[f"{prefix}_mtime"], updates[f"{prefix}_size"] = self.get_file_stat(file_path)
+        return updates
     
-    def update_data(self) -> bool:
+    def update_data(self, check_remote: bool = False) -> bool:
         """Update data files if needed based on hash comparison.
         
+        Files whose modification time and size match the values recorded
+        in the version file are assumed unchanged and are not re-hashed.
+        The OBO and PAF files are checked in parallel.
+        
+        Args:
+            check_remote: Also ask the servers whether newer files are
+                available, using the recorded ETag/Last-Modified values
+        
         Returns:
             True if update successful or no update needed, False otherwise
         """
@@ -127,38 +321,145 @@ class ProteinDataManager:
         version_info = self.load_version_info()
         current_time = datetime.now().isoformat()
         
-        # Check OBO file
-        obo_hash = self.calculate_file_hash(self.obo_file)
-        if obo_hash != version_info.get("obo_hash"):
-            print("OBO file needs update or doesn't exist")
-            if self.download_file(self.obo_url, self.obo_file):
-                new_obo_hash = self.calculate_file_hash(self.obo_file)
-                version_info["obo_hash"] = new_obo_hash
-                version_info["obo_last_updated"] = current_time
-            else:
-                return False
+        # Downloads and hashing release the GIL, so threads overlap the two files
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._update_one, "obo", self.obo_url, self.obo_file,
+                                version_info, check_remote, current_time),
+                executor.submit(self._update_one, "paf", self.paf_url, self.paf_file,
+                                version_info, check_remote, current_time),
+            ]
+            results = [future.result() for future in futures]
         
-        # Check PAF file
-        paf_hash = self.calculate_file_hash(self.paf_file)
-        if paf_hash != version_info.get("paf_hash"):
-            print("PAF file needs update or doesn't exist")
-            if self.download_file(self.paf_url, self.paf_file):
-                new_paf_hash = self.calculate_file_hash(self.paf_file)
-                version_info["paf_hash"] = new_paf_hash
-                version_info["paf_last_updated"] = current_time
-            else:
-                return False
+        # Merge on this thread only, and keep what succeeded even if one file failed
+        for updates in results:
+            if updates is not None:
+                version_info.update(updates)
         
         # Save updated version info
         self.save_version_info(version_info)
         
+        if None in results:
+            return False
+        
         print("Data files are up to date")
         return True
 
 
+class SearchText:
+    """Lowercased search text for a sequence of rows, stored as one string.
+    
+    Rows are joined with a record separator so a substring query is found
+    with str.find over a single buffer, and each hit is mapped back to its
+    row by bisecting the row start offsets.
+    """
+    
+    SEPARATOR = '\x1e'
+    
+    def __init__(self, rows: List[str] = ()):
+        """Build the search text.
+        
+        Args:
+            rows: Lowercased text per row; must not contain SEPARATOR
+        """
+        self.starts = array('q')
+        offset = 0
+        for row_text in rows:
+            self.starts.append(offset)
+            offset += len(row_text) + 1
+        self.text = self.SEPARATOR.join(rows)
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def row_text(self, row: int) -> str:
+        """Get the text of a single row."""
+        end = self.starts[row + 1] - 1 if row + 1 < len(self.starts) else len(self.text)
+        return self.text[self.starts[row]:end]
+    
+    def find_rows(self, query: str) -> Iterator[int]:
+        """Find the rows containing a query.
+        
+        Rows are found lazily, so callers that stop early skip the rest of the scan.
+        
+        Args:
+            query: Lowercased substring to look for
+            
+        Yields:
+            Matching row indices in ascending order
+        """
+        if not self.starts or self.SEPARATOR in query:
+            return
+        pos = self.text.find(query)
+        while pos != -1:
+            row = bisect_right(self.starts, pos) - 1
+            yield row
+            if row + 1 >= len(self.starts):
+                break
+            # Continue from the next row so each row is reported once
+            pos = self.text.find(query, self.starts[row + 1])
+
+
+class PAFTable:
+    """PAF annotation rows read on demand from the memory-mapped PAF file.
+    
+    Only the byte range of each row is kept in memory; rows are decoded
+    into column -> value dictionaries when accessed, and the operating
+    system's page cache holds the file contents.
+    """
+    
+    def __init__(self, header: List[str] = ()):
+        """Create an empty table.
+        
+        Args:
+            header: Column names
+        """
+        self.header = list(header)
+        self.starts = array('q')
+        self.ends = array('q')
+        self._mmap = None
+    
+    def __getstate__(self) -> Dict:
+        # The mapping can't be pickled; open() maps the file again after loading
+        state = self.__dict__.copy()
+        state['_mmap'] = None
+        return state
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def __getitem__(self, row: int) -> Dict[str, str]:
+        line = self._mmap[self.starts[row]:self.ends[row]].decode('utf-8')
+        return dict(zip(self.header, line.split('\t')))
+    
+    def __iter__(self):
+        return (self[row] for row in range(len(self)))
+    
+    def open(self, file_path: str) -> None:
+        """Memory-map the PAF file the row offsets refer to.
+        
+        Args:
+            file_path: Path to the PAF file
+        """
+        with open(file_path, 'rb') as f:
+            # An empty file can't be mapped, and has no rows to read anyway
+            if os.fstat(f.fileno()).st_size:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def append(self, start: int, end: int) -> None:
+        """Append a row by its byte range in the file (excluding the line ending)."""
+        self.starts.append(start)
+        self.ends.append(end)
+
+
 class ProteinDataParser:
     """Parses OBO and PAF files for querying."""
     
+    # Attributes saved to and restored from the parsed data caches
+    OBO_CACHED_ATTRS = ('obo_data', 'obo_ids', 'obo_search_text', 'obo_tokens', 'obo_token_rows')
+    PAF_CACHED_ATTRS = ('paf_data', 'paf_line_numbers', 'paf_by_protein',
+                        'paf_search_text', 'paf_tokens', 'paf_token_rows')
+    
     def __init__(self, data_manager: ProteinDataManager):
         """Initialize the parser.
         
@@ -166,58 +467,145 @@ class ProteinDataParser:
             data_manager: ProteinDataManager instance
         """
         self.data_manager = data_manager
-        self.obo_data = {}
-        self.paf_data = []
+        # Each source is parsed on first access of obo_data / paf_data
+        self._obo_data = {}
+        self._obo_loaded = False
+        self._paf_data = PAFTable()
+        self._paf_loaded = False
+        # Per-row integers are kept in typed arrays rather than lists of int objects
+        self.paf_line_numbers = array('I')
+        # PRO_ID -> row indices into paf_data, for direct per-protein lookups
+        self.paf_by_protein = {}
+        # Search indices: lowercased text per row, plus the distinct tokens of
+        # that text with the rows each token occurs in
+        self.obo_ids = []
+        self.obo_search_text = SearchText()
+        self.obo_tokens = SearchText()
+        self.obo_token_rows = []
+        self.paf_search_text = SearchText()
+        self.paf_tokens = SearchText()
+        self.paf_token_rows = []
         
+    @property
+    def obo_data(self) -> Dict[str, Dict]:
+        """Parsed OBO terms by ID, loaded on first access."""
+        if not self._obo_loaded:
+            self.load_obo_data()
+        return self._obo_data
+    
+    @obo_data.setter
+    def obo_data(self, value: Dict[str, Dict]) -> None:
+        self._obo_data = value
+    
+    @property
+    def paf_data(self) -> PAFTable:
+        """Parsed PAF annotation rows, loaded on first access."""
+        if not self._paf_loaded:
+            self.load_paf_data()
+        return self._paf_data
+    
+    @paf_data.setter
+    def paf_data(self, value: PAFTable) -> None:
+        self._paf_data = value
+    
+    def _load_cache(self, cache_file: str, source_hash: Optional[str], attrs: Tuple[str, ...]) -> bool:
+        """Restore parsed data from a cache file written for the same source file.
+        
+        Args:
+            cache_file: Path to the cache file
+            source_hash: Recorded hash of the source file, or None if unknown
+            attrs: Names of the attributes to restore
+            
+        Returns:
+            True if the cache was valid and loaded, False otherwise
+        """
+        if source_hash is None or not os.path.exists(cache_file):
+            return False
+        try:
+            with open(cache_file, 'rb') as f:
+                cache = pickle.load(f)
+            if cache.get('version') != CACHE_VERSION or cache.get('source_hash') != source_hash:
+                return False
+            for attr in attrs:
+                setattr(self, attr, cache['data'][attr])
+            return True
+        except Exception as e:
+            print(f"Error loading cache {cache_file}: {e}")
+            return False
+    
+    def _save_cache(self, cache_file: str, source_hash: Optional[str], attrs: Tuple[str, ...]) -> None:
+        """Save parsed data to a cache file keyed by the source file's hash.
+        
+        Args:
+            cache_file: Path to the cache file
+            source_hash: Recorded hash of the source file, or None if unknown
+            attrs: Names of the attributes to save
+        """
+        if source_hash is None:
+            return
+        cache = {
+            'version': CACHE_VERSION,
+            'source_hash': source_hash,
+            'data': {attr: getattr(self, attr) for attr in attrs}
+        }
+        tmp_file = cache_file + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"Error saving cache {cache_file}: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+    
     def load_obo_data(self) -> bool:
         """Load and parse OBO ontology data.
         
+        Parsed data is cached next to the source file and reused while the
+        source file's recorded hash is unchanged.
+        
         Returns:
             True if successful, False otherwise
         """
+        # Mark as loaded up front so a failed load isn't retried on every access
+        self._obo_loaded = True
+        obo_hash = self.data_manager.get_recorded_hash(self.data_manager.obo_file, "obo")
+        if self._load_cache(self.data_manager.obo_cache_file, obo_hash, self.OBO_CACHED_ATTRS):
+            print(f"Loaded {len(self.obo_data)} terms from OBO cache")
+            return True
+        
         try:
-            with open(self.data_manager.obo_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse OBO format - simplified parsing
-            current_term = {}
-            for line in content.split('\n'):
-                line = line.strip()
-                if line == '[Term]':
-                    if current_term and 'id' in current_term:
-                        # Ensure term ID is a string and all values are hashable
-                        term_id = str(current_term['id'])
-                        clean_term = {}
-                        for k, v in current_term.items():
-                            if isinstance(v, list):
-                                clean_term[k] = [str(x) for x in v]
-                            else:
-                                clean_term[k] = str(v)
-                        self.obo_data[term_id] = clean_term
-                    current_term = {}
-                elif ':' in line and current_term is not None:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key in current_term:
-                        if not isinstance(current_term[key], list):
-                            current_term[key] = [current_term[key]]
-                        current_term[key].append(value)
-                    else:
-                        current_term[key] = value
+            # Scan a read-only memory map instead of reading the whole file into
+            # a string; only one stanza at a time is decoded. An empty file
+            # can't be mapped, and simply has no terms
+            with open(self.data_manager.obo_file, 'rb') as f, \
+                    (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size
+                     else nullcontext(b'')) as content:
+                # Parse OBO format - find [Term] stanzas with one regex sweep, so
+                # header, [Typedef] and [Instance] lines never leak into a term
+                for match in OBO_TERM_RE.finditer(content):
+                    term = {}
+                    for line in match.group(1).decode('utf-8').split('\n'):
+                        key, sep, value = line.partition(':')
+                        if not sep:
+                            continue
+                        # Tag names repeat in every term, so share one object per tag
+                        key = sys.intern(key.strip())
+                        value = value.strip()
+                        if key in OBO_INTERNED_TAGS:
+                            value = sys.intern(value)
+                        if key in term:
+                            if not isinstance(term[key], list):
+                                term[key] = [term[key]]
+                            term[key].append(value)
+                        else:
+                            term[key] = value
+                    if 'id' in term:
+                        term_id = term['id']
+                        self.obo_data[term_id if isinstance(term_id, str) else term_id[0]] = term
             
-            # Add the last term
-            if current_term and 'id' in current_term:
-                # Ensure term ID is a string and all values are hashable
-                term_id = str(current_term['id'])
-                clean_term = {}
-                for k, v in current_term.items():
-                    if isinstance(v, list):
-                        clean_term[k] = [str(x) for x in v]
-                    else:
-                        clean_term[k] = str(v)
-                self.obo_data[term_id] = clean_term
-                
+            self._build_obo_search_index()
+            self._save_cache(self.data_manager.obo_cache_file, obo_hash, self.OBO_CACHED_ATTRS)
             print(f"Loaded {len(self.obo_data)} terms from OBO file")
             return True
             
@@ -228,39 +616,59 @@ class ProteinDataParser:
     def load_paf_data(self) -> bool:
         """Load and parse PAF annotation data.
         
+        Parsed data is cached the same way as for the OBO file.
+        
         Returns:
             True if successful, False otherwise
         """
-        try:
-            with open(self.data_manager.paf_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            if not lines:
-                print("PAF file is empty")
+        self._paf_loaded = True
+        paf_hash = self.data_manager.get_recorded_hash(self.data_manager.paf_file, "paf")
+        if self._load_cache(self.data_manager.paf_cache_file, paf_hash, self.PAF_CACHED_ATTRS):
+            try:
+                self.paf_data.open(self.data_manager.paf_file)
+            except Exception as e:
+                print(f"Error loading PAF data: {e}")
                 return False
+            print(f"Loaded {len(self.paf_data)} entries from PAF cache")
+            return True
+        
+        try:
+            search_rows = []
+            by_protein = defaultdict(list)
+            with open(self.data_manager.paf_file, 'rb') as f:
+                header_line = next(f, None)
+                if header_line is None:
+                    print("PAF file is empty")
+                    return False
+                
+                # Parse PAF format - tab-separated with header
+                header = header_line.decode('utf-8').rstrip('\r\n').split('\t')
+                print(f"PAF header: {header}")
+                
+                self.paf_data = PAFTable(header)
+                protein_column = header.index('PRO_ID') if 'PRO_ID' in header else None
+                
+                # Stream the rest line by line, keeping only each row's byte range
+                offset = len(header_line)
+                for line_num, line in enumerate(f, 2):  # Start from line 2
+                    start = offset
+                    offset += len(line)
+                    if line.strip() and not line.startswith(b'#'):
+                        line = line.rstrip(b'\r\n')
+                        parts = line.decode('utf-8').split('\t')
+                        if len(parts) >= len(header):  # Ensure we have all columns
+                            del parts[len(header):]
+                            protein_id = parts[protein_column] if protein_column is not None else None
+                            by_protein[protein_id].append(len(self.paf_data))
+                            search_rows.append('\t'.join(parts).lower())
+                            self.paf_data.append(start, start + len(line))
+                            self.paf_line_numbers.append(line_num)
             
-            # Parse PAF format - tab-separated with header
-            header = lines[0].strip().split('\t')
-            print(f"PAF header: {header}")
-            
-            for line_num, line in enumerate(lines[1:], 2):  # Start from line 2
-                if line.strip() and not line.startswith('#'):
-                    parts = line.strip().split('\t')
-                    if len(parts) >= len(header):  # Ensure we have all columns
-                        paf_entry = {
-                            'line_number': line_num,
-                            'raw_line': line.strip(),
-                            'fields': parts,
-                            'header': header
-                        }
-                        # Create a dictionary mapping header names to values
-                        entry_dict = {}
-                        for i, col_name in enumerate(header):
-                            if i < len(parts):
-                                entry_dict[col_name] = parts[i]
-                        paf_entry['data'] = entry_dict
-                        self.paf_data.append(paf_entry)
-            
+            self.paf_data.open(self.data_manager.paf_file)
+            self.paf_by_protein = {protein_id: array('I', rows) for protein_id, rows in by_protein.items()}
+            self.paf_search_text = SearchText(search_rows)
+            self.paf_tokens, self.paf_token_rows = self._build_token_index(search_rows)
+            self._save_cache(self.data_manager.paf_cache_file, paf_hash, self.PAF_CACHED_ATTRS)
             print(f"Loaded {len(self.paf_data)} entries from PAF file")
             return True
             
@@ -268,75 +676,189 @@ class ProteinDataParser:
             print(f"Error loading PAF data: {e}")
             return False
     
-    def search_obo_terms(self, query: str, search_fields: List[str] = None) -> List[Dict]:
+    @staticmethod
+    def _build_token_index(search_rows: List[str]) -> Tuple[SearchText, List[array]]:
+        """Build an inverted index of the whitespace-separated tokens of each row.
+        
+        Args:
+            search_rows: Lowercased search text per row
+            
+        Returns:
+            Tuple of (distinct tokens, row indices for each token)
+        """
+        token_index = defaultdict(list)
+        for row, text in enumerate(search_rows):
+            for token in text.split():
+                rows = token_index[token]
+                if not rows or rows[-1] != row:
+                    rows.append(row)
+        return SearchText(list(token_index)), [array('I', rows) for rows in token_index.values()]
+    
+    def _build_obo_search_index(self) -> None:
+        """Build lowercased search text and token index for the default OBO search fields."""
+        self.obo_ids = list(self.obo_data)
+        search_rows = []
+        for term_id in self.obo_ids:
+            term_data = self.obo_data[term_id]
+            fields = []
+            for field in OBO_SEARCH_FIELDS:
+                field_value = term_data.get(field, '')
+                if isinstance(field_value, list):
+                    field_value = ' '.join(field_value)
+                fields.append(field_value.lower())
+            # Values never contain newlines, so this keeps fields separable
+            search_rows.append('\n'.join(fields))
+        self.obo_search_text = SearchText(search_rows)
+        self.obo_tokens, self.obo_token_rows = self._build_token_index(search_rows)
+    
+    @staticmethod
+    def _match_rows(query_lower: str, tokens: SearchText, token_rows: List[array],
+                    search_text: SearchText, lazy: bool = False) -> Iterable[int]:
+        """Find rows whose search text contains the query.
+        
+        A query without whitespace can only occur inside a single token, so
+        it is matched against the distinct tokens of the index rather than
+        against every row.
+        
+        Args:
+            query_lower: Lowercased search query
+            tokens: Distinct tokens of the search text
+            token_rows: Row indices for each token
+            search_text: Lowercased search text per row
+            lazy: Yield rows as they are found, for callers that stop early
+            
+        Returns:
+            Matching row indices in ascending order
+        """
+        if query_lower.split() == [query_lower]:
+            if lazy:
+                matches = list(islice(tokens.find_rows(query_lower), MERGE_MAX_TOKENS + 1))
+                if len(matches) <= MERGE_MAX_TOKENS:
+                    return ProteinDataParser._merge_postings([token_rows[token] for token in matches])
+                return search_text.find_rows(query_lower)
+            rows = set()
+            for token in tokens.find_rows(query_lower):
+                rows.update(token_rows[token])
+            return sorted(rows)
+        return search_text.find_rows(query_lower)
+    
+    @staticmethod
+    def _merge_postings(postings: List[array]) -> Iterator[int]:
+        """Merge ascending row lists lazily, yielding each row once.
+        
+        Args:
+            postings: Row indices for each matching token, each in ascending order
+            
+        Yields:
+            Row indices in ascending order
+        """
+        last = -1
+        for row in heapq.merge(*postings):
+            if row != last:
+                yield row
+                last = row
+    
+    def search_obo_terms(self, query: str, search_fields: List[str] = None,
+                         limit: Optional[int] = None) -> List[Dict]:
         """Search OBO terms by query.
         
         Args:
             query: Search query string
             search_fields: Fields to search in (default: ['id', 'name', 'def'])
+            limit: Stop after this many results (default: no limit)
             
         Returns:
             List of matching terms
         """
         if not self.obo_data:
             return []
-            
-        if search_fields is None:
-            search_fields = ['id', 'name', 'def']
+        
+        # A tuple is cheaper to iterate per term than an arbitrary caller sequence
+        search_fields = OBO_SEARCH_FIELDS if search_fields is None else tuple(search_fields)
         
         results = []
         query_lower = query.lower()
         
+        if set(search_fields).issubset(OBO_SEARCH_FIELDS):
+            if '\n' in query_lower:
+                # Values never contain newlines, and the search text is newline-joined
+                return []
+            # Indexed fields use the cached lowercased text; the matched field is
+            # only worked out for candidate rows
+            field_positions = [(field, OBO_SEARCH_FIELDS.index(field)) for field in search_fields]
+            for row in self._match_rows(query_lower, self.obo_tokens, self.obo_token_rows,
+                                        self.obo_search_text, lazy=limit is not None):
+                if limit is not None and len(results) >= limit:
+                    break
+                field_texts = self.obo_search_text.row_text(row).split('\n')
+                matched_field = next((field for field, position in field_positions
+                                      if field_texts[position] and query_lower in field_texts[position]),
+                                     None)
+                if matched_field is None:
+                    continue
+                term_id = self.obo_ids[row]
+                term_data = self.obo_data[term_id]
+                results.append({
+                    'id': term_id,
+                    'name': term_data.get('name', 'N/A'),
+                    'definition': term_data.get('def', 'N/A'),
+                    'matched_field': matched_field
+                })
+            return results
+        
+        # Other fields aren't indexed, so they are lowercased per term
         for term_id, term_data in self.obo_data.items():
+            if limit is not None and len(results) >= limit:
+                break
             for field in search_fields:
-                if field in term_data:
-                    field_value = term_data[field]
-                    if isinstance(field_value, list):
-                        field_value_str = ' '.join(str(v) for v in field_value)
-                    else:
-                        field_value_str = str(field_value)
-                    
-                    if field_value_str and query_lower in field_value_str.lower():
-                        results.append({
-                            'id': term_id,
-                            'name': term_data.get('name', 'N/A'),
-                            'definition': term_data.get('def', 'N/A'),
-                            'matched_field': field
-                        })
-                        break
+                # One lookup per field; parsed values are already strings
+                field_value = term_data.get(field)
+                if not field_value:
+                    continue
+                if isinstance(field_value, list):
+                    field_value = ' '.join(field_value)
+                
+                if field_value and query_lower in field_value.lower():
+                    results.append({
+                        'id': term_id,
+                        'name': term_data.get('name', 'N/A'),
+                        'definition': term_data.get('def', 'N/A'),
+                        'matched_field': field
+                    })
+                    break
         
         return results
     
-    def search_paf_annotations(self, query: str) -> List[Dict]:
+    def search_paf_annotations(self, query: str, limit: Optional[int] = None) -> List[Dict]:
         """Search PAF annotations by query.
         
         Args:
             query: Search query string
+            limit: Stop after this many results (default: no limit)
             
         Returns:
             List of matching annotations
         """
         if not self.paf_data:
             return []
-            
-        results = []
+        
         query_lower = query.lower()
+        if '\t' in query_lower:
+            # Fields never contain tabs, and the search text is tab-joined
+            return []
         
-        for entry in self.paf_data:
-            # Search in all fields
-            match_found = False
-            for field_name, field_value in entry['data'].items():
-                if field_value and query_lower in field_value.lower():
-                    match_found = True
-                    break
-            
-            if match_found:
-                results.append({
-                    'line_number': entry['line_number'],
-                    'data': entry['data'],
-                    'protein_id': entry['data'].get('PRO_ID', 'N/A'),
-                    'annotation': entry['data'].get('Object_term', 'N/A')
-                })
+        results = []
+        for row in self._match_rows(query_lower, self.paf_tokens, self.paf_token_rows,
+                                    self.paf_search_text, lazy=limit is not None):
+            if limit is not None and len(results) >= limit:
+                break
+            entry = self.paf_data[row]
+            results.append({
+                'line_number': self.paf_line_numbers[row],
+                'data': entry,
+                'protein_id': entry.get('PRO_ID', 'N/A'),
+                'annotation': entry.get('Object_term', 'N/A')
+            })
         
         return results
     
@@ -360,18 +882,21 @@ class ProteinDataParser:
         Returns:
             List of annotation entries
         """
+        if not self.paf_data:
+            return []
+        
         results = []
-        for entry in self.paf_data:
-            if entry['data'].get('PRO_ID') == protein_id:
-                results.append({
-                    'line_number': entry['line_number'],
-                    'protein_id': entry['data'].get('PRO_ID', 'N/A'),
-                    'annotation': entry['data'].get('Object_term', 'N/A'),
-                    'full_data': entry['data'],
-                    'ontology_id': entry['data'].get('Ontology_ID', 'N/A'),
-                    'ontology_term': entry['data'].get('Ontology_term', 'N/A'),
-                    'relation': entry['data'].get('Relation', 'N/A')
-                })
+        for i in self.paf_by_protein.get(protein_id, []):
+            entry = self.paf_data[i]
+            results.append({
+                'line_number': self.paf_line_numbers[i],
+                'protein_id': entry.get('PRO_ID', 'N/A'),
+                'annotation': entry.get('Object_term', 'N/A'),
+                'full_data': entry,
+                'ontology_id': entry.get('Ontology_ID', 'N/A'),
+                'ontology_term': entry.get('Ontology_term', 'N/A'),
+                'relation': entry.get('Relation', 'N/A')
+            })
         return results
 
 
@@ -383,28 +908,23 @@ class InteractiveProteinTool:
         self.data_manager = ProteinDataManager()
         self.parser = ProteinDataParser(self.data_manager)
         
-    def setup(self) -> bool:
-        """Setup the tool by downloading and loading data.
+    def setup(self, check_remote: bool = False) -> bool:
+        """Setup the tool by downloading data files.
         
+        Args:
+            check_remote: Ask the servers whether newer data files are available
+            
         Returns:
             True if setup successful, False otherwise
         """
         print("=== Protein Ontology and Annotation Framework (POAF) ===")
         print("Setting up data files...")
         
-        if not self.data_manager.update_data():
+        if not self.data_manager.update_data(check_remote):
             print("Failed to update data files")
             return False
         
-        print("Loading data into memory...")
-        if not self.parser.load_obo_data():
-            print("Failed to load OBO data")
-            return False
-            
-        if not self.parser.load_paf_data():
-            print("Failed to load PAF data")
-            return False
-            
+        # OBO and PAF data are loaded into memory on first use
         print("Setup complete!")
         return True
     
@@ -445,20 +965,20 @@ class InteractiveProteinTool:
             return
         
         print(f"\nSearching OBO terms for: '{query}'")
-        results = self.parser.search_obo_terms(query)
+        # Only 10 results are shown; one more tells whether there are others
+        results = self.parser.search_obo_terms(query, limit=11)
         
         if not results:
             print("No results found")
         else:
-            print(f"\nFound {len(results)} results:")
+            print(f"\nFound {'more than 10' if len(results) > 10 else len(results)} results:")
             for i, result in enumerate(results[:10], 1):  # Show first 10 results
                 print(f"{i}. ID: {result['id']}")
                 print(f"   Name: {result['name']}")
                 print(f"   Matched field: {result['matched_field']}")
                 if i >= 10:
-                    remaining = len(results) - 10
-                    if remaining > 0:
-                        print(f"   ... and {remaining} more results")
+                    if len(results) > 10:
+                        print("   ... and more results")
                     break
             print()
     
@@ -470,20 +990,19 @@ class InteractiveProteinTool:
             return
         
         print(f"\nSearching PAF annotations for: '{query}'")
-        results = self.parser.search_paf_annotations(query)
+        results = self.parser.search_paf_annotations(query, limit=11)
         
         if not results:
             print("No results found")
         else:
-            print(f"\nFound {len(results)} results:")
+            print(f"\nFound {'more than 10' if len(results) > 10 else len(results)} results:")
             for i, result in enumerate(results[:10], 1):  # Show first 10 results
                 print(f"{i}. Line {result['line_number']}: {result['protein_id']}")
                 print(f"   Term: {result['annotation']}")
                 print(f"   Ontology: {result['data'].get('Ontology_term', 'N/A')}")
                 if i >= 10:
-                    remaining = len(results) - 10
-                    if remaining > 0:
-                        print(f"   ... and {remaining} more results")
+                    if len(results) > 10:
+                        print("   ... and more results")
                     break
             print()
     
@@ -556,13 +1075,15 @@ def main():
     parser = argparse.ArgumentParser(description="Protein Ontology and Annotation Framework")
     parser.add_argument('--update-only', action='store_true', 
                        help='Only update data files without starting interactive mode')
+    parser.add_argument('--check-remote', action='store_true',
+                       help='Check the servers for newer data files before starting')
     
     args = parser.parse_args()
     
     tool = InteractiveProteinTool()
     
     # Setup data
-    if not tool.setup():
+    if not tool.setup(args.check_remote):
         print("Setup failed. Exiting.")
         return 1
     